@@ -4,22 +4,72 @@ FastX-Tui DEM Fault Analyzer Plugin - 业务逻辑模块
 基于AUTOSAR CP和ETAS DEM的DTC故障状态分析工具
 """
 
-from dataclasses import dataclass
+from __future__ import annotations
 
-from rich.box import ROUNDED, SIMPLE, SQUARE
-from rich.columns import Columns
-from rich.console import Console, Group
-from rich.panel import Panel
-from rich.rule import Rule
-from rich.table import Table
-from rich.text import Text
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from io import StringIO
 
 from core.menu_system import ActionItem, CommandType, MenuSystem
 
-
-@dataclass
+# format_analysis结果缓存：状态码只有256种取值，首次渲染后直接复用字符串
+_ANALYSIS_CACHE: list[str | None] = [None] * 256
+
+# 预计算256种状态码的位表和二进制串，解析时直接查表，无需逐位移位
+_BITS_TABLE = [{bit: bool(value & (1 << bit)) for bit in range(8)} for value in range(256)]
+_BIN_TABLE = [format(value, '08b') for value in range(256)]
+
+# 每种状态码对应的置位bit列表（从高位到低位），免去运行期的过滤和排序
+_SET_BITS_DESC = [
+    tuple(bit for bit in range(7, -1, -1) if value & (1 << bit))
+    for value in range(256)
+]
+
+
+def _build_hex_lut() -> bytes:
+    """构建ASCII十六进制字符到数值的查找表，非法字符映射为0xFF"""
+    lut = bytearray([0xFF]) * 256
+    for value, char in enumerate('0123456789abcdef'):
+        lut[ord(char)] = value
+        lut[ord(char.upper())] = value
+    return bytes(lut)
+
+
+# 十六进制字符查找表
+_HEX_LUT = _build_hex_lut()
+
+
+def _parse_status_hex(status_hex: str) -> int:
+    """把单字节十六进制状态码解析为0-255的整数
+
+    通过查找表逐半字节取值，避免str.replace的中间字符串分配和
+    通用int()解析器的开销。非法输入抛出ValueError。
+    """
+    digits = status_hex[2:] if status_hex[:2] in ('0x', '0X') else status_hex
+    if not digits:
+        raise ValueError(f"无效的DTC状态码: {status_hex!r}")
+    digits = digits.lstrip('0') or '0'
+    if len(digits) > 2:
+        raise ValueError(f"无效的DTC状态码: {status_hex!r}")
+    hi_ord = ord(digits[0])
+    lo_ord = ord(digits[-1])
+    hi = _HEX_LUT[hi_ord] if hi_ord < 256 else 0xFF
+    lo = _HEX_LUT[lo_ord] if lo_ord < 256 else 0xFF
+    if len(digits) == 1:
+        hi = 0
+    if hi == 0xFF or lo == 0xFF:
+        raise ValueError(f"无效的DTC状态码: {status_hex!r}")
+    return (hi << 4) | lo
+
+
+@dataclass(frozen=True, slots=True)
 class BitInfo:
-    """状态位信息数据类"""
+    """状态位信息数据类
+
+    slots省去每实例__dict__，热路径上的属性访问更快；
+    frozen保证配置表在运行期只读。
+    """
     bit: int
     name: str
     abbr: str
@@ -29,7 +79,6 @@ class BitInfo:
     detailed_desc: str  # 详细描述
     set_conditions: list[str]  # 置位条件
     clear_conditions: list[str]  # 清除条件
-    mask: int  # 位掩码
 
 
 class DTCStatusConfig:
@@ -58,8 +107,7 @@ class DTCStatusConfig:
                 "下一个周期测试故障条件未满足时立即恢复为0",
                 "Dem_ClearDTC函数清除故障信息（USD 0x14服务，或OBD 0x04服务）",
                 "Dem_ResetEventStatus函数对该故障状态位进行复位"
-            ],
-            mask=0x01
+            ]
         ),
         BitInfo(
             bit=1,
@@ -79,8 +127,7 @@ operation cycle的起始点是ECU通过网络管理唤醒到ECU通过网络管
             clear_conditions=[
                 "该运行循环结束或新的运行循环开始",
                 "Dem_ClearDTC函数清除故障信息（USD 0x14服务，或OBD 0x04服务）"
-            ],
-            mask=0x02
+            ]
         ),
         BitInfo(
             bit=2,
@@ -103,8 +150,7 @@ pendingDTC 仍然为 1，再下一个operation cycle中，故障仍然不存在
             clear_conditions=[
                 "当前运行TestFailedThisOperationCycle未置为1，且TestNotCompletedThisOperationCycle未置为1，同时运行循环结束或者下一个运行循环开始",
                 "Dem_ClearDTC函数清除故障信息（USD 0x14服务，或OBD 0x04服务）"
-            ],
-            mask=0x04
+            ]
         ),
         BitInfo(
             bit=3,
@@ -126,8 +172,7 @@ pendingDTC 仍然为 1，再下一个operation cycle中，故障仍然不存在
                 "故障老化",
                 "故障替代",
                 "Dem_ClearDTC函数（USD 0x14服务，OBD为 0x04服务）清除故障信息"
-            ],
-            mask=0x08
+            ]
         ),
         BitInfo(
             bit=4,
@@ -144,8 +189,7 @@ pendingDTC 仍然为 1，再下一个operation cycle中，故障仍然不存在
             ],
             clear_conditions=[
                 "成功执行对故障进行检测后自动清除"
-            ],
-            mask=0x10
+            ]
         ),
         BitInfo(
             bit=5,
@@ -162,8 +206,7 @@ pendingDTC 仍然为 1，再下一个operation cycle中，故障仍然不存在
             ],
             clear_conditions=[
                 "Dem_ClearDTC函数清除故障信息"
-            ],
-            mask=0x20
+            ]
         ),
         BitInfo(
             bit=6,
@@ -180,8 +223,7 @@ pendingDTC 仍然为 1，再下一个operation cycle中，故障仍然不存在
             ],
             clear_conditions=[
                 "当前循环已对该故障进行检测测试后自动清除"
-            ],
-            mask=0x40
+            ]
         ),
         BitInfo(
             bit=7,
@@ -200,17 +242,18 @@ pendingDTC 仍然为 1，再下一个operation cycle中，故障仍然不存在
             clear_conditions=[
                 "ECU不请求激活警告指示",
                 "故障消失或降低严重程度后清除"
-            ],
-            mask=0x80
+            ]
         )
     ]
 
+    # 按bit序号索引的查找表，get_bit_info直接下标访问，避免每次线性扫描
+    _BITS_BY_INDEX = tuple(sorted(BIT_CONFIGS, key=lambda config: config.bit))
+
     @classmethod
     def get_bit_info(cls, bit: int) -> BitInfo | None:
         """获取指定bit的信息"""
-        for config in cls.BIT_CONFIGS:
-            if config.bit == bit:
-                return config
+        if 0 <= bit < 8:
+            return cls._BITS_BY_INDEX[bit]
         return None
 
     @classmethod
@@ -219,6 +262,138 @@ pendingDTC 仍然为 1，再下一个operation cycle中，故障仍然不存在
         return cls.BIT_CONFIGS
 
 
+# Rich导入和所有预构建的渲染对象都延迟到首次分析时初始化：
+# 从未进入DTC分析功能的用户不必承担Rich的导入和预构建开销
+_RICH_READY = False
+_RICH_INIT_LOCK = threading.Lock()
+
+# 渲染锁，保证并发调用时共享缓冲区内容不互相覆盖
+_RENDER_LOCK = threading.Lock()
+
+
+def _build_block_content(info: BitInfo) -> Text:
+    """预构建方块视图中单个位的静态文本（位号/缩写/名称）"""
+    name = info.name if len(info.name) <= 11 else info.name[:10] + "…"
+    text = Text(no_wrap=False)
+    text.append(f"Bit {info.bit}\n", style="bold cyan")
+    text.append(f"{info.abbr}\n", style="bold yellow")
+    text.append(f"{name}\n", style="italic")
+    return text
+
+
+def _make_bit_table() -> Table:
+    """生成已配置好5列schema的状态位表格，行数据由调用方填充"""
+    table = Table(
+        show_header=True,
+        header_style="bold blue",
+        box=SIMPLE,
+        show_lines=False,
+        width=146
+    )
+    table.add_column("位", style="cyan", no_wrap=True, justify="center")
+    table.add_column("名称", style="green")
+    table.add_column("缩写", style="yellow", no_wrap=True, justify="center")
+    table.add_column("状态", style="bold", no_wrap=True, justify="center")
+    table.add_column("描述", style="white")
+    return table
+
+
+def _init_rich() -> None:
+    """首次渲染时导入Rich并构建所有静态渲染对象"""
+    global _RICH_READY
+    global ROUNDED, SIMPLE, SQUARE, Console, Group, Panel, Rule, Table, Text
+    global _STATIC_BLOCK_CONTENT
+    global _INTRO_TEXTS, _DESC_TEXTS_SET, _DESC_TEXTS_CLR, _DETAIL_TEXTS
+    global _SET_CONDITION_TEXTS, _CLEAR_CONDITION_TEXTS
+    global _TITLE_DTC, _TITLE_DIST, _TITLE_TABLE, _TITLE_DETAIL, _ALL_CLEAR_TEXT
+    global _DETAIL_TITLE, _SET_COND_TITLE, _CLEAR_COND_TITLE
+    global _RENDER_BUFFER, _RENDER_CONSOLE, _PANEL_KW
+    global _DETAIL_CONTENT_SET, _DETAIL_CONTENT_CLR, _BIT_RULES
+
+    with _RICH_INIT_LOCK:
+        if _RICH_READY:
+            return
+
+        from rich.box import ROUNDED, SIMPLE, SQUARE
+        from rich.console import Console, Group
+        from rich.panel import Panel
+        from rich.rule import Rule
+        from rich.table import Table
+        from rich.text import Text
+
+        # 方块视图的静态部分逐位预构建，渲染时只需复制并补上状态单元格
+        _STATIC_BLOCK_CONTENT = tuple(
+            _build_block_content(info) for info in DTCStatusConfig.BIT_CONFIGS
+        )
+
+        # 位详情中的静态文本逐位预构建，渲染时直接引用，不再每次用f-string重建
+        _INTRO_TEXTS = tuple(Text(f"简介: {info.intro}") for info in DTCStatusConfig.BIT_CONFIGS)
+        _DESC_TEXTS_SET = tuple(Text(f"状态描述: {info.desc_true}") for info in DTCStatusConfig.BIT_CONFIGS)
+        _DESC_TEXTS_CLR = tuple(Text(f"状态描述: {info.desc_false}") for info in DTCStatusConfig.BIT_CONFIGS)
+        _DETAIL_TEXTS = tuple(Text(info.detailed_desc) for info in DTCStatusConfig.BIT_CONFIGS)
+        _SET_CONDITION_TEXTS = tuple(
+            tuple(Text(f"  • {condition}\n") for condition in info.set_conditions)
+            for info in DTCStatusConfig.BIT_CONFIGS
+        )
+        _CLEAR_CONDITION_TEXTS = tuple(
+            tuple(Text(f"  • {condition}\n") for condition in info.clear_conditions)
+            for info in DTCStatusConfig.BIT_CONFIGS
+        )
+
+        # format_analysis中的固定小节标题，样式只解析一次
+        _TITLE_DTC = Text("[DTC状态码分析]\n")
+        _TITLE_DTC.stylize("bold cyan", 0, len("DTC状态码分析"))
+        _TITLE_DIST = Text("[状态位分布]\n")
+        _TITLE_DIST.stylize("magenta", 0, len("状态位分布"))
+        _TITLE_TABLE = Text("\n[状态位详细信息]\n")
+        _TITLE_TABLE.stylize("magenta", 0, len("状态位详细信息"))
+        _TITLE_DETAIL = Text("[置位状态位详细解析]\n")
+        _TITLE_DETAIL.stylize("magenta", 0, len("置位状态位详细解析"))
+        _ALL_CLEAR_TEXT = Text("⚠ 所有状态位均为复位状态\n", style="yellow")
+
+        # 位详情中的固定标题
+        _DETAIL_TITLE = Text("详细说明: ")
+        _DETAIL_TITLE.stylize("cyan", 0, 4)
+        _SET_COND_TITLE = Text("置位条件: ")
+        _SET_COND_TITLE.stylize("cyan", 0, 4)
+        _CLEAR_COND_TITLE = Text("清除条件: ")
+        _CLEAR_COND_TITLE.stylize("cyan", 0, 4)
+
+        # 渲染共用同一个Console和缓冲区，避免每次分析都重新初始化Console
+        _RENDER_BUFFER = StringIO()
+        _RENDER_CONSOLE = Console(file=_RENDER_BUFFER, width=146)
+
+        # 外层Panel的固定构造参数，每次渲染只需补上随输入变化的subtitle
+        _PANEL_KW = dict(
+            title="DEM故障分析器",
+            title_align="center",
+            border_style="cyan",
+            box=ROUNDED,
+            padding=(1, 2)
+        )
+
+        # 16种位详情内容（8个位×置位/复位）和8个Rule分隔头一次性构建
+        _DETAIL_CONTENT_SET = tuple(
+            ISO14229DTCSTATUS._build_bit_detail_content(info, True)
+            for info in DTCStatusConfig.BIT_CONFIGS
+        )
+        _DETAIL_CONTENT_CLR = tuple(
+            ISO14229DTCSTATUS._build_bit_detail_content(info, False)
+            for info in DTCStatusConfig.BIT_CONFIGS
+        )
+        _BIT_RULES = tuple(
+            Rule(f"Bit {info.bit} - {info.name} ({info.abbr})", align="left")
+            for info in DTCStatusConfig.BIT_CONFIGS
+        )
+
+        _RICH_READY = True
+
+    # 0x00（健康ECU）和0xFF是最常见的两个取值，初始化完成后立即预热缓存，
+    # 之后对它们的分析都是O(1)的字符串返回，不再走渲染路径
+    ISO14229DTCSTATUS.format_analysis("0x00")
+    ISO14229DTCSTATUS.format_analysis("0xFF")
+
+
 class ISO14229DTCSTATUS:
     """DTC状态位解析类"""
 
@@ -226,160 +401,125 @@ class ISO14229DTCSTATUS:
     def parse_status_code(status_hex: str) -> dict:
         """解析DTC状态码"""
         # 转换为整数
-        status_int = int(status_hex.replace('0x', '').replace('0X', ''), 16)
-
-        # 解析每个位
-        bits = {}
-        for bit in range(8):
-            bits[bit] = (status_int & (1 << bit)) != 0
+        status_int = _parse_status_hex(status_hex)
 
         return {
             'hex': status_hex,
             'decimal': status_int,
-            'binary': bin(status_int)[2:].zfill(8),
-            'bits': bits
+            'binary': _BIN_TABLE[status_int],
+            'bits': _BITS_TABLE[status_int]
         }
 
     @staticmethod
     def format_analysis(status_hex: str) -> str:
         """格式化分析结果 - 合并为一个Panel"""
-        result = ISO14229DTCSTATUS.parse_status_code(status_hex)
+        # 归一化为0-255的整数，"0x6c"、"6C"、"0X6C"等写法命中同一缓存槽
+        status_int = _parse_status_hex(status_hex)
+        cached = _ANALYSIS_CACHE[status_int]
+        if cached is not None:
+            return cached
+
+        # 缓存未命中才需要Rich，首次调用时完成导入和预构建
+        if not _RICH_READY:
+            _init_rich()
 
-        # 使用StringIO捕获输出
-        from io import StringIO
-        output = StringIO()
-        console = Console(file=output, width=146)
+        status_hex = f"0x{status_int:02X}"
+        result = ISO14229DTCSTATUS.parse_status_code(status_hex)
 
         # 构建完整的Panel内容
         content_parts = []
 
         # 1. 状态码信息 - 标题使用特定颜色但不影响宽度
-        title_text = Text("[DTC状态码分析]\n")
-        title_text.stylize("bold cyan", 0, len("DTC状态码分析"))
-
-        content_parts.append(title_text)
+        content_parts.append(_TITLE_DTC)
 
-        # 状态码信息
-        status_info = Text(f"HEX: {result['hex']} | DEC: {result['decimal']} | BIN: {result['binary']}\n\n")
-        content_parts.append(status_info)
+        # 状态码信息，正文和Panel副标题共用同一个摘要串
+        status_summary = f"HEX: {result['hex']} | DEC: {result['decimal']} | BIN: {result['binary']}"
+        content_parts.append(Text(f"{status_summary}\n\n"))
 
         # 2. 方块视图 - 使用原来的版本但确保一行显示
-        section_title = Text("[状态位分布]\n")
-        section_title.stylize("magenta", 0, len("状态位分布"))
-
-        content_parts.append(section_title)
+        content_parts.append(_TITLE_DIST)
         content_parts.append(ISO14229DTCSTATUS._render_bit_blocks(result))
 
         # 3. 表格视图
-        table_title = Text("\n[状态位详细信息]\n")
-        table_title.stylize("magenta", 0, len("状态位详细信息"))
-
-        content_parts.append(table_title)
+        content_parts.append(_TITLE_TABLE)
         content_parts.append(ISO14229DTCSTATUS._render_bit_table(result))
         content_parts.append(Text("\n"))
 
         # 4. 置位bit详细解析
-        set_bits = [bit for bit, is_set in result['bits'].items() if is_set]
+        set_bits = _SET_BITS_DESC[status_int]
         if set_bits:
-            detail_title = Text("[置位状态位详细解析]\n")
-            detail_title.stylize("magenta", 0, len("置位状态位详细解析"))
-
-            content_parts.append(detail_title)
+            content_parts.append(_TITLE_DETAIL)
 
-            for bit in sorted(set_bits, reverse=True):  # 从高位到低位
+            for bit in set_bits:  # 从高位到低位
                 bit_info = DTCStatusConfig.get_bit_info(bit)
                 if bit_info:
                     # 使用Rule作为分隔符，只显示Bit编号和名称
-                    content_parts.append(Rule(f"Bit {bit} - {bit_info.name} ({bit_info.abbr})", align="left"))
+                    content_parts.append(_BIT_RULES[bit])
 
                     detail_content = ISO14229DTCSTATUS._create_bit_detail_content(bit_info, is_set=True)
                     content_parts.append(detail_content)
                     content_parts.append(Text("\n"))
         else:
-            content_parts.append(Text("⚠ 所有状态位均为复位状态\n", style="yellow"))
+            content_parts.append(_ALL_CLEAR_TEXT)
 
         # 将所有内容组合
         content = Group(*content_parts)
 
         # 创建单一Panel，Title靠左对齐
-        analysis_panel = Panel(
-            content,
-            title="DEM故障分析器",
-            title_align="center",
-            subtitle=f"HEX: {result['hex']} | DEC: {result['decimal']} | BIN: {result['binary']}",
-            border_style="cyan",
-            box=ROUNDED,
-            padding=(1, 2)
-        )
+        analysis_panel = Panel(content, subtitle=status_summary, **_PANEL_KW)
 
-        console.print(analysis_panel)
+        # 复用共享Console输出到缓冲区，取走结果后清空以备下次渲染
+        with _RENDER_LOCK:
+            _RENDER_BUFFER.seek(0)
+            _RENDER_BUFFER.truncate(0)
+            _RENDER_CONSOLE.print(analysis_panel)
+            rendered = _RENDER_BUFFER.getvalue()
 
-        return output.getvalue()
+        _ANALYSIS_CACHE[status_int] = rendered
+        return rendered
 
     @staticmethod
-    def _render_bit_blocks(result: dict) -> Columns:
-        """渲染方块视图 - 使用原来的版本但确保一行显示"""
-        blocks = []
+    def format_analysis_batch(codes: Iterable[str]) -> list[str]:
+        """批量格式化分析结果
+
+        复用256项结果缓存，N个状态码只对未命中的取值做完整渲染，
+        重复出现的状态码是O(1)的字符串取用。
+        """
+        return [ISO14229DTCSTATUS.format_analysis(code) for code in codes]
+
+    @staticmethod
+    def _render_bit_blocks(result: dict) -> Table:
+        """渲染方块视图 - 单个Table一行8格，比8个Panel加Columns渲染开销小"""
+        table = Table(
+            show_header=False,
+            box=SQUARE,
+            padding=(0, 1),
+            show_lines=False
+        )
 
-        # 从高位到低位（Bit7到Bit0）
+        # 从高位到低位（Bit7到Bit0），每个位占一列
+        cells = []
         for bit in reversed(range(8)):
             is_set = result['bits'][bit]
-            bit_info = DTCStatusConfig.get_bit_info(bit)
 
-            if bit_info:
-                # 构建方块内容 - 使用原来的格式
-                block_content = Text(no_wrap=False)
-                block_content.append(f"Bit {bit}\n", style="bold cyan")
-                block_content.append(f"{bit_info.abbr}\n", style="bold yellow")
-
-                # 状态名称截断处理
-                name_lines = bit_info.name
-                if len(name_lines) > 11:
-                    name_lines = bit_info.name[:10] + "…"
-                block_content.append(f"{name_lines}\n", style="italic")
-
-                # 根据状态添加状态指示
-                if is_set:
-                    status_text = Text(" 1 ", style="bold white on red")
-                else:
-                    status_text = Text(" 0 ", style="bold white on green")
-
-                block_content.append(status_text)
-
-                # 创建方块 - 调整为适合一行显示
-                block = Panel(
-                    block_content,
-                    # title=f"Bit {bit}",
-                    # subtitle=f"{status_text}",
-                    border_style="red" if is_set else "green",
-                    width=16,
-                    height=6,
-                    box=SQUARE,
-                    padding=(0, 0)
-                )
-                blocks.append(block)
+            # 复制预构建的静态内容，只补上随输入变化的状态指示
+            cell = _STATIC_BLOCK_CONTENT[bit].copy()
+            if is_set:
+                cell.append(Text(" 1 ", style="bold white on red"))
+            else:
+                cell.append(Text(" 0 ", style="bold white on green"))
+
+            table.add_column(width=14, justify="center", no_wrap=False)
+            cells.append(cell)
 
-        # 使用Columns在一行显示所有方块，增加console宽度确保不换行
-        return Columns(blocks, padding=1, expand=False)
+        table.add_row(*cells)
+        return table
 
     @staticmethod
     def _render_bit_table(result: dict) -> Table:
         """渲染表格视图 - 完整显示，不截断"""
-        # 创建表格
-        table = Table(
-            show_header=True,
-            header_style="bold blue",
-            box=SIMPLE,
-            show_lines=False,
-            width=146
-        )
-
-        # 定义列
-        table.add_column("位", style="cyan", no_wrap=True, justify="center")
-        table.add_column("名称", style="green")
-        table.add_column("缩写", style="yellow", no_wrap=True, justify="center")
-        table.add_column("状态", style="bold", no_wrap=True, justify="center")
-        table.add_column("描述", style="white")
+        # 从工厂取已配置好列schema的表格，这里只负责填充行
+        table = _make_bit_table()
 
         # 从高位到低位显示（Bit 7 到 Bit 0）
         for bit in reversed(range(8)):
@@ -412,9 +552,17 @@ class ISO14229DTCSTATUS:
 
     @staticmethod
     def _create_bit_detail_content(bit_info: BitInfo, is_set: bool) -> Group:
-        """创建位详情内容"""
+        """获取位详情内容 - 8个位×置位/复位共16种，全部预构建好直接取用"""
+        if is_set:
+            return _DETAIL_CONTENT_SET[bit_info.bit]
+        return _DETAIL_CONTENT_CLR[bit_info.bit]
 
-        # 构建内容
+    @staticmethod
+    def _build_bit_detail_content(bit_info: BitInfo, is_set: bool) -> Group:
+        """构建位详情内容"""
+        bit = bit_info.bit
+
+        # 组合预构建的静态片段，只有状态行随is_set变化
         content_parts = []
 
         # 1. 状态信息（单独一行）
@@ -429,38 +577,26 @@ class ISO14229DTCSTATUS:
         content_parts.append(Text("\n"))
 
         # 2. 简介（单独一行）
-        intro_line = Text(f"简介: {bit_info.intro}")
-        content_parts.append(intro_line)
+        content_parts.append(_INTRO_TEXTS[bit])
         content_parts.append(Text("\n"))
 
         # 3. 状态描述
-        desc_title = Text(f"状态描述: {bit_info.desc_true if is_set else bit_info.desc_false}")
-        content_parts.append(desc_title)
+        content_parts.append(_DESC_TEXTS_SET[bit] if is_set else _DESC_TEXTS_CLR[bit])
         content_parts.append(Text("\n\n"))
 
         # 4. 详细说明
-        detail_title = Text("详细说明: ")
-        detail_title.stylize("cyan", 0, 4)
-        detail_text = Text(f"{bit_info.detailed_desc}")
-        content_parts.append(detail_title)
-        content_parts.append(detail_text)
+        content_parts.append(_DETAIL_TITLE)
+        content_parts.append(_DETAIL_TEXTS[bit])
         content_parts.append(Text("\n"))
 
         # 5. 置位/清除条件
         if is_set:
-            cond_title = Text("置位条件: ")
-            cond_title.stylize("cyan", 0, 4)
-            content_parts.append(cond_title)
-            # content_parts.append(Text("\n"))
-            for condition in bit_info.set_conditions:
-                content_parts.append(Text(f"  • {condition}\n"))
+            content_parts.append(_SET_COND_TITLE)
+            content_parts.extend(_SET_CONDITION_TEXTS[bit])
         else:
-            cond_title = Text("清除条件: ")
-            cond_title.stylize("cyan", 0, 4)
-            content_parts.append(cond_title)
+            content_parts.append(_CLEAR_COND_TITLE)
             content_parts.append(Text("\n"))
-            for condition in bit_info.clear_conditions:
-                content_parts.append(Text(f"  • {condition}\n"))
+            content_parts.extend(_CLEAR_CONDITION_TEXTS[bit])
 
         return Group(*content_parts)
 
@@ -471,16 +607,11 @@ class DEMFaultAnalyzer:
     def __init__(self, plugin_instance):
         """初始化业务逻辑"""
         self.plugin = plugin_instance
+        # 直接绑定插件的日志方法，省去转发函数的调用开销
+        self.log_info = plugin_instance.log_info
+        self.log_warning = plugin_instance.log_warning
         self.log_info("DEM故障分析器业务逻辑初始化完成")
 
-    def log_info(self, msg: str, *args, **kwargs):
-        """记录信息日志"""
-        self.plugin.log_info(msg, *args, **kwargs)
-
-    def log_warning(self, msg: str, *args, **kwargs):
-        """记录警告日志"""
-        self.plugin.log_warning(msg, *args, **kwargs)
-
     def register_commands(self, menu_system: MenuSystem):
         """注册插件命令到菜单系统"""
         # 创建插件的子菜单
@@ -513,8 +644,18 @@ class DEMFaultAnalyzer:
             python_func=self.parse_dtc_status
         ))
 
+        # 注册批量分析命令
+        menu_system.register_item(ActionItem(
+            id="parse_dtc_status_batch",
+            name="批量DTC分析",
+            description="一次输入多个DTC状态码，批量输出分析结果",
+            command_type=CommandType.PYTHON,
+            python_func=self.parse_dtc_status_batch
+        ))
+
         # 将命令添加到菜单
         menu_system.add_item_to_menu("fault_analysis_menu", "parse_dtc_status")
+        menu_system.add_item_to_menu("fault_analysis_menu", "parse_dtc_status_batch")
 
         # 构建菜单结构
         dem_main_menu.add_item("fault_analysis_menu")
@@ -536,9 +677,13 @@ class DEMFaultAnalyzer:
             if not status_input.startswith(('0x', '0X')):
                 status_input = '0x' + status_input
 
-            # 验证并解析
-            status_int = int(status_input, 16)
-            if status_int < 0 or status_int > 255:
+            # 先用查找表校验每个字符，误输入时不必走int()的异常路径
+            digits = status_input[2:]
+            if not digits or any(ord(c) > 255 or _HEX_LUT[ord(c)] == 0xFF for c in digits):
+                return "[red]❌ 无效的十六进制格式！请输入有效的DTC状态码。[/red]"
+
+            # 验证取值范围
+            if len(digits.lstrip('0') or '0') > 2:
                 return "[red]❌ 无效的DTC状态码！状态码必须是1字节（0x00-0xFF）。[/red]"
 
             # 调用分析函数
@@ -548,3 +693,27 @@ class DEMFaultAnalyzer:
             return "[red]❌ 无效的十六进制格式！请输入有效的DTC状态码。[/red]"
         except Exception as e:
             return f"[red]❌ 解析过程中发生错误：{str(e)}[/red]"
+
+    def parse_dtc_status_batch(self) -> str:
+        """批量解析DTC状态码"""
+        try:
+            # 获取用户输入，一行多个状态码
+            batch_input = input("请输入DTC状态码列表（空格或逗号分隔，如：0x01 6C FF）: ").strip()
+
+            # 验证输入格式
+            if not batch_input:
+                return "[red]❌ 输入不能为空！[/red]"
+
+            # 逐个解析，非法的状态码以错误行输出，不中断整批
+            outputs = []
+            for code in batch_input.replace(',', ' ').split():
+                status_input = code if code.startswith(('0x', '0X')) else '0x' + code
+                try:
+                    outputs.append(ISO14229DTCSTATUS.format_analysis(status_input))
+                except ValueError:
+                    outputs.append(f"[red]❌ 无效的DTC状态码：{code}[/red]")
+
+            return '\n'.join(outputs)
+
+        except Exception as e:
+            return f"[red]❌ 批量解析过程中发生错误：{str(e)}[/red]"
@@ -9,7 +9,12 @@ import json
 import os
 from typing import Any
 
-import toml
+try:
+    import tomllib  # Python 3.11+ 标准库，C实现解析更快
+except ImportError:
+    tomllib = None
+    import toml
+
 from dem_fault_analyzer import DEMFaultAnalyzer
 
 from core.menu_system import MenuSystem
@@ -22,27 +27,40 @@ class DEMFaultAnalyzerPlugin(Plugin):
     这是FastX-Tui插件的入口类，所有插件必须继承自Plugin类并实现所有抽象方法。
     """
 
+    # 版本号缓存，pyproject.toml只在首次调用时解析一次
+    _cached_version: str | None = None
+
     def __init__(self):
         """初始化插件"""
         super().__init__()
         self.business = None
+        # manual.md和config_schema.json在插件生命周期内不变，只读取一次
+        self._manual_cache: str | None = None
+        self._schema_cache: dict[str, Any] | None = None
 
     @classmethod
     def get_version(cls) -> str:
         """从pyproject.toml获取当前版本号"""
+        if cls._cached_version is not None:
+            return cls._cached_version
         try:
             # 获取当前文件所在目录
             current_dir = os.path.dirname(os.path.abspath(__file__))
             # 构建pyproject.toml的路径
             pyproject_path = os.path.join(current_dir, "pyproject.toml")
             # 读取文件
-            with open(pyproject_path, encoding="utf-8") as f:
-                data = toml.load(f)
-            # 返回版本号
-            return data["project"]["version"]
+            if tomllib is not None:
+                with open(pyproject_path, "rb") as f:
+                    data = tomllib.load(f)
+            else:
+                with open(pyproject_path, encoding="utf-8") as f:
+                    data = toml.load(f)
+            # 缓存版本号
+            cls._cached_version = data["project"]["version"]
         except Exception:
             # 如果读取失败，返回默认版本
-            return "1.0.0"
+            cls._cached_version = "1.0.0"
+        return cls._cached_version
 
     def get_info(self) -> PluginInfo:
         """获取插件信息"""
@@ -86,15 +104,19 @@ class DEMFaultAnalyzerPlugin(Plugin):
         Returns:
             str: Markdown格式的插件手册，从manual.md文件中读取
         """
+        if self._manual_cache is not None:
+            return self._manual_cache
         try:
             # 获取插件目录路径
             if self.plugin_path:
                 manual_path = os.path.join(self.plugin_path, "manual.md")
                 if os.path.exists(manual_path):
                     with open(manual_path, encoding="utf-8") as f:
-                        return f.read()
+                        self._manual_cache = f.read()
+                        return self._manual_cache
             # 如果文件不存在或plugin_path未设置，返回默认内容
-            return "# 插件手册\n\n该插件未提供帮助文档。"
+            self._manual_cache = "# 插件手册\n\n该插件未提供帮助文档。"
+            return self._manual_cache
         except Exception as e:
             self.log_error(f"读取插件手册失败: {e}")
             return "# 插件手册\n\n读取帮助文档失败。"
@@ -105,15 +127,18 @@ class DEMFaultAnalyzerPlugin(Plugin):
         Returns:
             Dict[str, Any]: 配置项模式，包含配置名、类型、默认值、说明、可选值等
         """
+        if self._schema_cache is not None:
+            return self._schema_cache
         try:
             # 获取插件目录路径
             if self.plugin_path:
                 config_schema_path = os.path.join(self.plugin_path, "config_schema.json")
                 if os.path.exists(config_schema_path):
                     with open(config_schema_path, encoding="utf-8") as f:
-                        return json.load(f)
+                        self._schema_cache = json.load(f)
+                        return self._schema_cache
             # 如果文件不存在或plugin_path未设置，返回默认配置
-            return {
+            self._schema_cache = {
                 "enabled": {
                     "type": "boolean",
                     "default": True,
@@ -121,6 +146,7 @@ class DEMFaultAnalyzerPlugin(Plugin):
                     "required": True
                 }
             }
+            return self._schema_cache
         except Exception as e:
             self.log_error(f"读取配置模式失败: {e}")
             # 返回默认配置